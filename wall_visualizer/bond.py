@@ -3,13 +3,21 @@ from __future__ import annotations
 
 import math
 import random
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Iterable, List, Sequence
+from functools import lru_cache
+from itertools import accumulate
+from types import MappingProxyType
+from typing import Deque, Dict, List, Mapping, Sequence, Tuple
 
 from .config import WallConfig
 from .models import BrickKind, BrickSpec
 
 
+# Interned, read-only metadata shared by every English-cross header brick.
+_CROSS_METADATA: Mapping[str, str] = MappingProxyType({"role": "cross"})
+
+
 class BondError(ValueError):
     """Raised when a strategy cannot satisfy the requested configuration."""
 
@@ -29,16 +37,22 @@ class BondStrategy:
 
     @staticmethod
     def _sequence_width(sequence: Sequence[BrickSpec], config: WallConfig) -> float:
-        total = 0.0
-        for idx, brick in enumerate(sequence):
-            total += brick.length_mm
-            if idx < len(sequence) - 1:
-                total += config.head_joint_mm
-        return total
+        joints = max(0, len(sequence) - 1)
+        return sum(brick.length_mm for brick in sequence) + joints * config.head_joint_mm
 
     @staticmethod
-    def _brick(kind: BrickKind, config: WallConfig, metadata: dict | None = None) -> BrickSpec:
-        return BrickSpec(kind=kind, length_mm=config.length_for_kind(kind.value), metadata=metadata)
+    def _brick(
+        kind: BrickKind, config: WallConfig, metadata: Mapping[str, str] | None = None
+    ) -> BrickSpec:
+        length_mm = config.length_for_kind(kind.value)
+        if metadata is None:
+            return _shared_spec(kind, length_mm)
+        return BrickSpec(kind=kind, length_mm=length_mm, metadata=metadata)
+
+    def _repeat(self, kind: BrickKind, count: int, config: WallConfig) -> List[BrickSpec]:
+        if count <= 0:
+            return []
+        return [self._brick(kind, config)] * count
 
     def _validate_wall_width(self, sequence: Sequence[BrickSpec], config: WallConfig) -> None:
         width = self._sequence_width(sequence, config)
@@ -48,22 +62,56 @@ class BondStrategy:
             )
 
 
+@lru_cache(maxsize=None)
+def _shared_spec(kind: BrickKind, length_mm: float) -> BrickSpec:
+    # BrickSpec is frozen, so metadata-free specs can be shared between bricks.
+    return BrickSpec(kind=kind, length_mm=length_mm)
+
+
 @dataclass
-class StretcherBond(BondStrategy):
+class ParityBondStrategy(BondStrategy):
+    """Bond whose courses depend only on course parity, built once per config."""
+
+    _course_cache: Dict[Tuple[WallConfig, int], Tuple[BrickSpec, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def reset(self, config: WallConfig) -> None:
+        del config
+        self._course_cache.clear()
+
+    def generate_course(self, course_index: int, config: WallConfig) -> List[BrickSpec]:
+        return list(self._ensure_cached(course_index % 2, config))
+
+    def _ensure_cached(self, parity: int, config: WallConfig) -> Tuple[BrickSpec, ...]:
+        key = (config, parity)
+        cached = self._course_cache.get(key)
+        if cached is None:
+            # Validate once per (config, parity); later courses reuse the checked tuple.
+            sequence = self._build_course(parity, config)
+            self._validate_wall_width(sequence, config)
+            cached = tuple(sequence)
+            self._course_cache[key] = cached
+        return cached
+
+    def _build_course(self, parity: int, config: WallConfig) -> List[BrickSpec]:
+        raise NotImplementedError
+
+
+@dataclass
+class StretcherBond(ParityBondStrategy):
     """Classic stretcher bond with alternating half-brick offsets."""
 
     name: str = "stretcher"
 
-    def generate_course(self, course_index: int, config: WallConfig) -> List[BrickSpec]:
+    def _build_course(self, parity: int, config: WallConfig) -> List[BrickSpec]:
         total_units = config.total_half_modules()
-        is_even = course_index % 2 == 0
+        is_even = parity == 0
 
         if is_even:
             sequence = self._generate_even_course(total_units, config)
         else:
             sequence = self._generate_odd_course(total_units, config)
-
-        self._validate_wall_width(sequence, config)
         return sequence
 
     def _generate_even_course(self, total_units: int, config: WallConfig) -> List[BrickSpec]:
@@ -108,52 +156,42 @@ class StretcherBond(BondStrategy):
         sequence.extend(self._repeat(BrickKind.HALF, 1, config))
         return sequence
 
-    def _repeat(self, kind: BrickKind, count: int, config: WallConfig) -> List[BrickSpec]:
-        if count <= 0:
-            return []
-        return [self._brick(kind, config) for _ in range(count)]
-
 
 @dataclass
-class FlemishBond(BondStrategy):
+class FlemishBond(ParityBondStrategy):
     """Alternating headers and stretchers with staggered starters each course."""
 
     name: str = "flemish"
 
-    def generate_course(self, course_index: int, config: WallConfig) -> List[BrickSpec]:
-        start_kind = BrickKind.HEADER if course_index % 2 == 0 else BrickKind.FULL
-        alt_kind = BrickKind.FULL if start_kind == BrickKind.HEADER else BrickKind.HEADER
+    def _build_course(self, parity: int, config: WallConfig) -> List[BrickSpec]:
+        header = self._brick(BrickKind.HEADER, config)
+        full = self._brick(BrickKind.FULL, config)
+        start, alt = (header, full) if parity == 0 else (full, header)
+        joint = config.head_joint_mm
+        pair_width = header.length_mm + full.length_mm + 2 * joint
 
-        sequence: List[BrickSpec] = []
-        current_width = 0.0
-        expected = start_kind
-        while True:
-            brick = self._brick(expected, config)
-            if sequence:
-                current_width += config.head_joint_mm
-            current_width += brick.length_mm
-            if current_width - config.wall_width_mm > 1e-6:
-                raise BondError("Flemish bond could not align with wall width")
-            sequence.append(brick)
-            if abs(current_width - config.wall_width_mm) <= 1e-6:
-                break
-            expected = alt_kind if expected == start_kind else start_kind
-        self._validate_wall_width(sequence, config)
-        return sequence
+        # 2k bricks span k * pair_width - joint; 2k + 1 bricks span start + k * pair_width.
+        for span, tail in (
+            (config.wall_width_mm + joint, []),
+            (config.wall_width_mm - start.length_mm, [start]),
+        ):
+            pairs = int(round(span / pair_width))
+            if pairs >= 0 and abs(pairs * pair_width - span) <= 1e-6:
+                return [start, alt] * pairs + tail
+        raise BondError("Flemish bond could not align with wall width")
 
 
 @dataclass
-class EnglishCrossBond(BondStrategy):
+class EnglishCrossBond(ParityBondStrategy):
     """Alternate courses of stretchers and headers with central cross headers."""
 
     name: str = "english-cross"
 
-    def generate_course(self, course_index: int, config: WallConfig) -> List[BrickSpec]:
-        if course_index % 2 == 0:
+    def _build_course(self, parity: int, config: WallConfig) -> List[BrickSpec]:
+        if parity == 0:
             sequence = self._stretcher_course(config)
         else:
             sequence = self._header_course(config)
-        self._validate_wall_width(sequence, config)
         return sequence
 
     def _header_course(self, config: WallConfig) -> List[BrickSpec]:
@@ -176,16 +214,11 @@ class EnglishCrossBond(BondStrategy):
 
         sequence: List[BrickSpec] = [self._brick(BrickKind.HALF, config)]
         sequence.extend(self._repeat(BrickKind.FULL, full_left, config))
-        sequence.append(self._brick(BrickKind.HEADER, config, metadata={"role": "cross"}))
+        sequence.append(self._brick(BrickKind.HEADER, config, metadata=_CROSS_METADATA))
         sequence.extend(self._repeat(BrickKind.FULL, full_right, config))
         sequence.append(self._brick(BrickKind.HALF, config))
         return sequence
 
-    def _repeat(self, kind: BrickKind, count: int, config: WallConfig) -> List[BrickSpec]:
-        if count <= 0:
-            return []
-        return [self._brick(kind, config) for _ in range(count)]
-
 
 @dataclass
 class WildBond(BondStrategy):
@@ -196,9 +229,16 @@ class WildBond(BondStrategy):
     max_attempts: int = 500
     max_overlap_ratio: float = 0.35
     _rng: random.Random = field(init=False, repr=False)
-    _previous_joints: List[List[float]] = field(default_factory=list, init=False, repr=False)
+    _previous_joints: Deque[List[float]] = field(
+        default_factory=lambda: deque(maxlen=2), init=False, repr=False
+    )
     _step_direction: int = field(default=0, init=False, repr=False)
     _step_run: int = field(default=0, init=False, repr=False)
+    # Per-course constants, refreshed at the top of generate_course.
+    _course_modules: int = field(default=0, init=False, repr=False)
+    _course_overlap_limit: int = field(default=0, init=False, repr=False)
+    _course_tolerance: float = field(default=0.0, init=False, repr=False)
+    _course_prev_masks: List[int] = field(default_factory=list, init=False, repr=False)
 
     def __post_init__(self) -> None:
         self._rng = random.Random(self.seed)
@@ -210,6 +250,14 @@ class WildBond(BondStrategy):
         self._step_run = 0
 
     def generate_course(self, course_index: int, config: WallConfig) -> List[BrickSpec]:
+        self._course_modules = config.total_half_modules()
+        self._course_overlap_limit = self._overlap_limit(config)
+        self._course_tolerance = config.head_joint_mm * 0.5
+        half_module = config.half_module_mm
+        self._course_prev_masks = [
+            sum(1 << module for module in {int(round(pos / half_module)) for pos in joints})
+            for joints in self._previous_joints
+        ]
         for _ in range(self.max_attempts):
             sequence = self._attempt_sequence(config)
             joints = self._joint_positions(sequence, config)
@@ -226,102 +274,51 @@ class WildBond(BondStrategy):
                 self._step_direction = direction
                 self._step_run = 1
             self._previous_joints.append(joints)
-            if len(self._previous_joints) > 2:
-                self._previous_joints.pop(0)
             self._validate_wall_width(sequence, config)
             return sequence
         raise BondError("Unable to generate wild bond course within attempt budget")
 
     def _attempt_sequence(self, config: WallConfig) -> List[BrickSpec]:
-        modules = config.total_half_modules()
-        half_module = config.half_module_mm
-        prev_sets = [
-            {int(round(pos / half_module)) for pos in joints}
-            for joints in self._previous_joints
-        ]
-        overlap_limit = self._overlap_limit(config)
-
-        increments: List[int] = []
-        overlap_counts = [0 for _ in prev_sets]
-        solution: List[int] | None = None
-
-        def backtrack(used_modules: int, half_count: int, full_count: int) -> bool:
-            nonlocal solution
-            if used_modules == modules:
-                if half_count == 0 or full_count == 0:
-                    return False
-                solution = increments.copy()
-                return True
-
-            options = [1, 2]
-            self._rng.shuffle(options)
-            for step in options:
-                if used_modules + step > modules:
-                    continue
-                if step == 1 and increments:
-                    last_step = increments[-1]
-                    is_edge = used_modules == 0 or used_modules + step == modules
-                    if last_step == 1 and not is_edge:
-                        continue
-
-                new_overlaps = overlap_counts.copy()
-                next_modules = used_modules + step
-                if next_modules < modules:
-                    module_index = next_modules
-                    violate = False
-                    for idx, prev in enumerate(prev_sets):
-                        if module_index in prev:
-                            new_overlaps[idx] += 1
-                            if new_overlaps[idx] > overlap_limit:
-                                violate = True
-                                break
-                    if violate:
-                        continue
-
-                increments.append(step)
-                prev_counts = overlap_counts.copy()
-                overlap_counts[:] = new_overlaps
-                if backtrack(
-                    next_modules,
-                    half_count + (1 if step == 1 else 0),
-                    full_count + (1 if step == 2 else 0),
-                ):
-                    return True
-                overlap_counts[:] = prev_counts
-                increments.pop()
-            return False
-
-        if not backtrack(0, 0, 0):
+        solution = _wild_backtrack(
+            self._course_modules, self._course_overlap_limit, self._course_prev_masks, self._rng
+        )
+        if solution is None:
             raise BondError("Unable to satisfy wild bond course width")
 
         sequence: List[BrickSpec] = []
-        for step in solution or []:
+        for step in solution:
             kind = BrickKind.HALF if step == 1 else BrickKind.FULL
             sequence.append(self._brick(kind, config))
         return sequence
 
     def _joint_positions(self, sequence: Sequence[BrickSpec], config: WallConfig) -> List[float]:
-        pos = 0.0
-        joints: List[float] = []
-        for idx, spec in enumerate(sequence):
-            pos += spec.length_mm
-            if idx < len(sequence) - 1:
-                pos += config.head_joint_mm
-                joints.append(pos)
-        return joints
+        head_joint = config.head_joint_mm
+        return list(accumulate(spec.length_mm + head_joint for spec in sequence[:-1]))
 
     def _violates_prev_course(self, joints: List[float], config: WallConfig) -> bool:
+        del config
         if not self._previous_joints:
             return False
-        tolerance = config.head_joint_mm / 2.0
-        overlap_limit = self._overlap_limit(config)
+        tolerance = self._course_tolerance
+        overlap_limit = self._course_overlap_limit
+        joint_count = len(joints)
+        # Joint lists are ascending by construction, so walk both with two pointers.
         for prev in self._previous_joints:
             overlaps = 0
-            for joint in joints:
-                if any(abs(joint - prev_joint) <= tolerance for prev_joint in prev):
+            prev_count = len(prev)
+            i = j = 0
+            while i < joint_count and j < prev_count:
+                joint = joints[i]
+                prev_joint = prev[j]
+                if prev_joint < joint - tolerance:
+                    j += 1
+                elif prev_joint <= joint + tolerance:
                     overlaps += 1
                     if overlaps > overlap_limit:
                         return True
+                    i += 1
+                else:
+                    i += 1
         return False
 
     def _overlap_limit(self, config: WallConfig) -> int:
@@ -344,6 +341,101 @@ class WildBond(BondStrategy):
         return 0
 
 
+_STEP_OPTIONS = (1, 2)
+_STEP_OPTIONS_REVERSED = (2, 1)
+
+
+def _wild_backtrack(
+    modules: int,
+    overlap_limit: int,
+    prev_masks: Sequence[int],
+    rng: random.Random,
+) -> List[int] | None:
+    """Fill ``modules`` half-modules with 1/2-module steps using an explicit stack.
+
+    ``prev_masks`` holds one bitmask per previous course with bit ``n`` set when
+    that course has a head joint at module ``n``.
+
+    Each frame holds a node's ordered step options and the index of the next
+    option to try; ``increments`` and ``bumped`` grow and shrink with it, where
+    ``bumped`` records which overlap counters each step incremented so they can
+    be decremented in place on backtrack.
+    """
+    increments: List[int] = []
+    bumped: List[List[int]] = []
+    overlap_counts = [0 for _ in prev_masks]
+    used_modules = half_count = full_count = 0
+
+    def new_frame() -> List:
+        # A single random bit orders the two step options; no list or shuffle needed.
+        return [_STEP_OPTIONS if rng.getrandbits(1) else _STEP_OPTIONS_REVERSED, 0]
+
+    frames = [new_frame()]
+    while frames:
+        frame = frames[-1]
+        options, cursor = frame
+        descended = False
+        while cursor < len(options):
+            step = options[cursor]
+            cursor += 1
+            if used_modules + step > modules:
+                continue
+            if step == 1 and increments:
+                last_step = increments[-1]
+                is_edge = used_modules == 0 or used_modules + step == modules
+                if last_step == 1 and not is_edge:
+                    continue
+
+            next_modules = used_modules + step
+            incremented: List[int] = []
+            if next_modules < modules:
+                module_bit = 1 << next_modules
+                violate = False
+                for idx, prev_mask in enumerate(prev_masks):
+                    if prev_mask & module_bit:
+                        overlap_counts[idx] += 1
+                        incremented.append(idx)
+                        if overlap_counts[idx] > overlap_limit:
+                            violate = True
+                            break
+                if violate:
+                    for idx in incremented:
+                        overlap_counts[idx] -= 1
+                    continue
+
+            increments.append(step)
+            bumped.append(incremented)
+            used_modules = next_modules
+            half_count += step == 1
+            full_count += step == 2
+            if used_modules < modules:
+                frame[1] = cursor
+                frames.append(new_frame())
+                descended = True
+                break
+            if half_count and full_count:
+                return increments
+            # Full width reached without mixing brick kinds: undo and try the next option.
+            increments.pop()
+            for idx in bumped.pop():
+                overlap_counts[idx] -= 1
+            used_modules -= step
+            half_count -= step == 1
+            full_count -= step == 2
+
+        if descended:
+            continue
+        frames.pop()
+        if frames:
+            step = increments.pop()
+            for idx in bumped.pop():
+                overlap_counts[idx] -= 1
+            used_modules -= step
+            half_count -= step == 1
+            full_count -= step == 2
+    return None
+
+
 def bond_catalog() -> dict[str, BondStrategy]:
     return {
         StretcherBond().name: StretcherBond(),
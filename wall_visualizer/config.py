@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 @dataclass(frozen=True)
@@ -45,13 +46,7 @@ class WallConfig:
         summing bricks. This ensures the module count remains an integer for valid
         configurations.
         """
-        total = self.wall_width_mm + self.head_joint_mm
-        module = self.half_module_mm
-        if abs(round(total / module) - total / module) > 1e-6:
-            raise ValueError(
-                "Wall width does not align to half-brick modules with current configuration"
-            )
-        return int(round(total / module))
+        return _total_half_modules(self.wall_width_mm, self.head_joint_mm, self.half_module_mm)
 
     def length_for_kind(self, kind: str) -> float:
         if kind == "full":
@@ -67,4 +62,14 @@ class WallConfig:
         raise KeyError(f"Unknown brick kind length for '{kind}'")
 
 
+@lru_cache(maxsize=16)
+def _total_half_modules(wall_width_mm: float, head_joint_mm: float, module: float) -> int:
+    total = wall_width_mm + head_joint_mm
+    if abs(round(total / module) - total / module) > 1e-6:
+        raise ValueError(
+            "Wall width does not align to half-brick modules with current configuration"
+        )
+    return int(round(total / module))
+
+
 DEFAULT_CONFIG = WallConfig()
@@ -1,7 +1,7 @@
 """Interactive controller for stepping through build sequences."""
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Set
 
 from .models import Wall
 from .renderer import Renderer
@@ -27,6 +27,10 @@ class WallController:
         self.orders: Dict[str, List[int]] = {
             name: strategy.order_bricks(wall) for name, strategy in strategies.items()
         }
+        # Summaries depend only on the wall and the fixed order, so compute them once.
+        self.summaries: Dict[str, str] = {
+            name: strategies[name].summarize(wall, order) for name, order in self.orders.items()
+        }
         self.status_message = ""
         self._reset_progress()
 
@@ -64,18 +68,19 @@ class WallController:
     def _render(self) -> None:
         order = self.orders[self.current_strategy_name]
         next_brick_id = order[self.progress] if self.progress < len(order) else None
-        built_so_far = order[: self.progress]
         strategy = self.strategies[self.current_strategy_name]
-        summary = strategy.summarize(self.wall, order)
+        summary = self.summaries[self.current_strategy_name]
         screen = self.renderer.render(
             wall=self.wall,
-            built_bricks=built_so_far,
+            built_bricks=self.built,
             strategy_name=strategy.name,
             strategy_description=strategy.description,
             summary=summary,
             next_brick_id=next_brick_id,
             commands_hint=self._commands_hint(),
+            changed_bricks=self._changed,
         )
+        self._changed = set()
         print("\033[H\033[J", end="")  # clear screen
         print(screen)
         if self.status_message:
@@ -88,6 +93,12 @@ class WallController:
             return False
         brick_id = order[self.progress]
         self.progress += 1
+        self.built.add(brick_id)
+        # Only the placed brick and the newly scheduled one change appearance.
+        if self._changed is not None:
+            self._changed.add(brick_id)
+            if self.progress < len(order):
+                self._changed.add(order[self.progress])
         brick = self.wall.brick_by_id(brick_id)
         self.status_message = (
             f"Placed brick {brick.brick_id} (course={brick.course_index}, stride={brick.stride_id}, "
@@ -97,6 +108,9 @@ class WallController:
 
     def _reset_progress(self) -> None:
         self.progress = 0
+        self.built: Set[int] = set()
+        # Bricks whose glyph changed since the last frame; None forces a full redraw.
+        self._changed: Set[int] | None = None
 
     def _cycle_strategy(self) -> None:
         idx = self.strategy_names.index(self.current_strategy_name)
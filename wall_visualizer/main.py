@@ -4,7 +4,7 @@ from __future__ import annotations
 import argparse
 from typing import Dict
 
-from .bond import DEFAULT_BOND_NAME, bond_catalog
+from .bond import DEFAULT_BOND_NAME, BondStrategy, bond_catalog
 from .config import DEFAULT_CONFIG, WallConfig
 from .controller import WallController
 from .renderer import Renderer
@@ -17,8 +17,11 @@ def build_strategy_catalog() -> Dict[str, BuildStrategy]:
     return {optimized.name: optimized}
 
 
-def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
-    bonds = bond_catalog()
+def parse_args(
+    argv: list[str] | None = None, bonds: Dict[str, BondStrategy] | None = None
+) -> argparse.Namespace:
+    if bonds is None:
+        bonds = bond_catalog()
     parser = argparse.ArgumentParser(description="Interactive masonry wall build visualizer")
     parser.add_argument(
         "--no-colour",
@@ -41,9 +44,10 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
 
 
 def main(argv: list[str] | None = None) -> None:
-    args = parse_args(argv)
+    bonds = bond_catalog()
+    args = parse_args(argv, bonds)
     config: WallConfig = DEFAULT_CONFIG
-    bond = bond_catalog()[args.bond]
+    bond = bonds[args.bond]
     builder = WallBuilder(config=config, bond=bond)
     wall = builder.build()
 
@@ -1,9 +1,10 @@
 """Data models for walls, bricks, and strides."""
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Sequence
+from typing import List, Mapping, Sequence
 
 from .config import WallConfig
 
@@ -16,14 +17,14 @@ class BrickKind(str, Enum):
     QUARTER = "quarter"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrickSpec:
     kind: BrickKind
     length_mm: float
-    metadata: dict | None = None
+    metadata: Mapping[str, str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Brick:
     brick_id: int
     course_index: int
@@ -53,7 +54,7 @@ class Stride:
     y_mm: float
     width_mm: float
     height_mm: float
-    bricks: List[int] = field(default_factory=list)
+    bricks: array = field(default_factory=lambda: array("i"))  # brick ids
 
 
 @dataclass
@@ -61,9 +62,38 @@ class Wall:
     config: WallConfig
     bricks: List[Brick]
     strides: List[Stride]
+    # Struct-of-arrays mirrors of the brick geometry, indexed by brick id.
+    x_mm: array = field(init=False, repr=False)
+    y_mm: array = field(init=False, repr=False)
+    length_mm: array = field(init=False, repr=False)
+    height_mm: array = field(init=False, repr=False)
+    course_index: array = field(init=False, repr=False)
+    stride_id: array = field(init=False, repr=False)  # -1 where unassigned
+    bricks_by_course: List[List[Brick]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        bricks = self.bricks
+        self.x_mm = array("d", [b.x_mm for b in bricks])
+        self.y_mm = array("d", [b.y_mm for b in bricks])
+        self.length_mm = array("d", [b.length_mm for b in bricks])
+        self.height_mm = array("d", [b.height_mm for b in bricks])
+        self.course_index = array("i", [b.course_index for b in bricks])
+        self.stride_id = array("i", [-1 if b.stride_id is None else b.stride_id for b in bricks])
+        course_count = max(self.course_index, default=-1) + 1
+        self.bricks_by_course = [[] for _ in range(course_count)]
+        for brick in bricks:
+            self.bricks_by_course[brick.course_index].append(brick)
 
     def brick_by_id(self, brick_id: int) -> Brick:
         return self.bricks[brick_id]
 
     def bricks_in_course(self, course_index: int) -> Sequence[Brick]:
-        return [b for b in self.bricks if b.course_index == course_index]
+        if 0 <= course_index < len(self.bricks_by_course):
+            return self.bricks_by_course[course_index]
+        return []
+
+    def bricks_by_stride(self, stride_id: int) -> Sequence[Brick]:
+        return [self.bricks[bid] for bid in self.strides[stride_id].bricks]
+
+    def bricks_in_course_mask(self, course_index: int) -> List[bool]:
+        return [c == course_index for c in self.course_index]
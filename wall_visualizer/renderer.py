@@ -1,7 +1,8 @@
 """ASCII renderer for the wall state."""
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Sequence
+from array import array
+from typing import AbstractSet, Dict, Iterable, List, Sequence, Tuple
 
 from .config import WallConfig
 from .models import Brick, Wall
@@ -21,6 +22,30 @@ class Renderer:
         self.line_width = int(round(config.wall_width_mm / scale_mm))
         if self.line_width <= 0:
             raise ValueError("Scale produces zero-width render line")
+        self._blank_line = " " * self.line_width
+        # Precomputed (prefix, cell, suffix) glyph parts; a run is prefix + cell * n + suffix.
+        self._palette_size = len(STRIDE_COLOURS) if use_colour else len(STRIDE_SYMBOLS)
+        self._glyph_table: Dict[Tuple[int, str, bool], Tuple[str, str, str]] = {
+            (index, symbol, built): self._glyph_parts(index, symbol, built)
+            for index in range(self._palette_size)
+            for symbol in ("█", "▒", "░")
+            for built in (True, False)
+        }
+        self._run_cache: Dict[Tuple[Tuple[int, str, bool], int], str] = {}
+        # Single-byte cells for the no-colour path, keyed like the glyph table.
+        self._ascii_cells: Dict[Tuple[int, str, bool], bytes] = (
+            {}
+            if use_colour
+            else {key: parts[1].encode("ascii") for key, parts in self._glyph_table.items()}
+        )
+        # Column spans per brick id, computed once for the most recently rendered wall.
+        self._span_wall: Wall | None = None
+        self._start_cols: array = array("i")
+        self._end_cols: array = array("i")
+        # Rendered line per course index from the previous frame, reset with the spans.
+        self._course_lines: List[str] = []
+        self._legend_wall: Wall | None = None
+        self._legend = ""
 
     def render(
         self,
@@ -31,8 +56,16 @@ class Renderer:
         summary: str,
         next_brick_id: int | None,
         commands_hint: str,
+        changed_bricks: Iterable[int] | None = None,
     ) -> str:
-        built_set = set(built_bricks)
+        """Render a full frame.
+
+        When ``changed_bricks`` is given, only the courses containing those bricks
+        are redrawn and every other course reuses its line from the previous frame.
+        """
+        # Callers that track progress incrementally can pass their set as-is.
+        built_set = built_bricks if isinstance(built_bricks, (set, frozenset)) else set(built_bricks)
+        self._ensure_spans(wall)
         lines: List[str] = []
 
         lines.append(f"Strategy: {strategy_name} – {strategy_description}")
@@ -40,62 +73,162 @@ class Renderer:
             lines.append(summary)
         lines.append(f"Commands: {commands_hint}")
 
-        for course in reversed(range(self.config.course_count())):
-            course_bricks = [b for b in wall.bricks if b.course_index == course]
-            course_line = self._render_course(course_bricks, built_set, next_brick_id)
-            lines.append(course_line)
+        lines.extend(
+            reversed(self._update_course_lines(wall, built_set, next_brick_id, changed_bricks))
+        )
         lines.append(self._render_stride_legend(wall))
         return "\n".join(lines)
 
+    def _update_course_lines(
+        self,
+        wall: Wall,
+        built_set: AbstractSet[int],
+        next_brick_id: int | None,
+        changed_bricks: Iterable[int] | None,
+    ) -> List[str]:
+        if changed_bricks is None or not self._course_lines:
+            courses: Iterable[int] = range(self.config.course_count())
+            self._course_lines = [self._blank_line] * self.config.course_count()
+        else:
+            courses = {wall.course_index[bid] for bid in changed_bricks}
+        for course in courses:
+            self._course_lines[course] = self._render_course(
+                wall.bricks_in_course(course), built_set, next_brick_id
+            )
+        return self._course_lines
+
     def _render_course(
         self,
         bricks: Sequence[Brick],
-        built_set: set[int],
+        built_set: AbstractSet[int],
+        next_brick_id: int | None,
+    ) -> str:
+        if not bricks:
+            return self._blank_line
+        if self.use_colour:
+            return self._render_course_colour(bricks, built_set, next_brick_id)
+        return self._render_course_ascii(bricks, built_set, next_brick_id)
+
+    def _render_course_ascii(
+        self,
+        bricks: Sequence[Brick],
+        built_set: AbstractSet[int],
+        next_brick_id: int | None,
+    ) -> str:
+        buf = bytearray(b" " * self.line_width)
+        cells = self._ascii_cells
+        palette_size = self._palette_size
+        for brick in bricks:
+            start, end = self._brick_span(brick)
+            if start >= end:
+                continue
+            if brick.stride_id is None:
+                # Bricks without a stride keep their shade glyph, which needs the general path.
+                return self._render_course_colour(bricks, built_set, next_brick_id)
+            built = brick.brick_id in built_set
+            shade = self._brick_shade(brick, built, next_brick_id)
+            buf[start:end] = cells[(brick.stride_id % palette_size, shade, built)] * (end - start)
+        return buf.decode("ascii")
+
+    def _render_course_colour(
+        self,
+        bricks: Sequence[Brick],
+        built_set: AbstractSet[int],
         next_brick_id: int | None,
     ) -> str:
-        chars: List[str] = [" "] * self.line_width
+        segments: List[str] = []
+        cursor = 0
         for brick in bricks:
-            start = int(round(brick.x_mm / self.scale_mm))
-            end = int(round((brick.x_mm + brick.length_mm) / self.scale_mm))
-            start = max(start, 0)
-            end = min(end, self.line_width)
+            start, end = self._brick_span(brick)
+            start = max(start, cursor)
             if start >= end:
                 continue
-            char = "░"
-            if brick.brick_id in built_set:
-                char = "█"
-            elif next_brick_id is not None and brick.brick_id == next_brick_id:
-                char = "▒"
-            glyph = self._colourise(char, brick.stride_id, brick.brick_id in built_set)
-            for idx in range(start, end):
-                chars[idx] = glyph
-        return "".join(chars)
-
-    def _colourise(self, symbol: str, stride_id: int | None, built: bool) -> str:
+            if start > cursor:
+                segments.append(" " * (start - cursor))
+            segments.append(self._brick_glyph(brick, built_set, next_brick_id, end - start))
+            cursor = end
+        if cursor < self.line_width:
+            segments.append(" " * (self.line_width - cursor))
+        return "".join(segments)
+
+    def _ensure_spans(self, wall: Wall) -> None:
+        if self._span_wall is wall:
+            return
+        starts = array("i")
+        ends = array("i")
+        scale = self.scale_mm
+        for x_mm, length_mm in zip(wall.x_mm, wall.length_mm):
+            start = int(round(x_mm / scale))
+            end = int(round((x_mm + length_mm) / scale))
+            starts.append(max(start, 0))
+            ends.append(min(end, self.line_width))
+        self._span_wall = wall
+        self._start_cols = starts
+        self._end_cols = ends
+        self._course_lines = []
+
+    def _brick_span(self, brick: Brick) -> Tuple[int, int]:
+        return self._start_cols[brick.brick_id], self._end_cols[brick.brick_id]
+
+    def _brick_glyph(
+        self, brick: Brick, built_set: AbstractSet[int], next_brick_id: int | None, width: int = 1
+    ) -> str:
+        built = brick.brick_id in built_set
+        char = self._brick_shade(brick, built, next_brick_id)
+        return self._colourise(char, brick.stride_id, built, width)
+
+    @staticmethod
+    def _brick_shade(brick: Brick, built: bool, next_brick_id: int | None) -> str:
+        if built:
+            return "█"
+        if next_brick_id is not None and brick.brick_id == next_brick_id:
+            return "▒"
+        return "░"
+
+    def _colourise(self, symbol: str, stride_id: int | None, built: bool, width: int = 1) -> str:
+        """Return ``width`` cells of ``symbol``; colour codes wrap the whole run once."""
         if stride_id is None:
-            return symbol
+            return symbol * width
+        key = (stride_id % self._palette_size, symbol, built)
+        # Brick widths take only a handful of values, so whole runs are worth memoising.
+        run = self._run_cache.get((key, width))
+        if run is None:
+            parts = self._glyph_table.get(key)
+            if parts is None:
+                parts = self._glyph_parts(*key)
+            prefix, cell, suffix = parts
+            run = f"{prefix}{cell * width}{suffix}"
+            self._run_cache[(key, width)] = run
+        return run
+
+    def _glyph_parts(self, palette_index: int, symbol: str, built: bool) -> Tuple[str, str, str]:
         if not self.use_colour:
-            base = STRIDE_SYMBOLS[stride_id % len(STRIDE_SYMBOLS)]
+            base = STRIDE_SYMBOLS[palette_index]
             if symbol == "█":
-                return base.upper()
+                return "", base.upper(), ""
             if symbol == "░":
-                return base.lower()
+                return "", base.lower(), ""
             if symbol == "▒":
-                return base
-            return symbol
-        colour = STRIDE_COLOURS[stride_id % len(STRIDE_COLOURS)]
+                return "", base, ""
+            return "", symbol, ""
+        colour = STRIDE_COLOURS[palette_index]
         if built:
-            return f"{ANSI_BOLD}{colour}{symbol}{ANSI_RESET}"
-        return f"{colour}{symbol}{ANSI_RESET}"
+            return f"{ANSI_BOLD}{colour}", symbol, ANSI_RESET
+        return colour, symbol, ANSI_RESET
 
     def _render_stride_legend(self, wall: Wall) -> str:
-        seen: Dict[int, str] = {}
+        # The legend depends only on the wall's strides, so build it once per wall.
+        if self._legend_wall is wall:
+            return self._legend
+        seen_tokens: set[str] = set()
         entries: List[str] = []
         for stride in sorted(wall.strides, key=lambda s: s.stride_id):
             token = self._colourise("█", stride.stride_id, True)
-            if token in seen.values():
+            if token in seen_tokens:
                 token = self._colourise("█", stride.stride_id + 1, True)
             label = f"stride {stride.stride_id} (col={stride.col}, row={stride.row})"
             entries.append(f"{token} {label}")
-            seen[stride.stride_id] = token
-        return "Legend: " + ", ".join(entries)
+            seen_tokens.add(token)
+        self._legend_wall = wall
+        self._legend = "Legend: " + ", ".join(entries)
+        return self._legend
@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List
+from itertools import pairwise
+from typing import Iterable, List, Tuple
 
-from .models import Brick, Wall
+from .models import Wall
 
 
 class BuildStrategy:
@@ -28,53 +29,26 @@ class OptimizedStrideStrategy(BuildStrategy):
     )
 
     def order_bricks(self, wall: Wall) -> List[int]:
-        stride_order = sorted(
-            wall.strides,
-            key=lambda s: (s.row, s.col),
-        )
-
-        ordered: List[int] = []
-        for stride in stride_order:
-            bricks = [wall.brick_by_id(bid) for bid in stride.bricks]
-            bricks.sort(key=lambda b: (b.course_index, b.x_mm))
-            current_course = None
-            course_bricks: List[Brick] = []
+        course_of = wall.course_index
+        x_of = wall.x_mm
 
-            def flush_course(course_list: List[Brick]) -> None:
-                if not course_list:
-                    return
-                course_idx = course_list[0].course_index
-                reverse = course_idx % 2 == 1
-                course_list.sort(key=lambda b: b.x_mm, reverse=reverse)
-                ordered.extend(b.brick_id for b in course_list)
+        def serpentine_key(bid: int) -> Tuple[int, float]:
+            # Odd courses run right-to-left, so flip the x key instead of regrouping.
+            course = course_of[bid]
+            return course, -x_of[bid] if course % 2 else x_of[bid]
 
-            for brick in bricks:
-                if current_course is None:
-                    current_course = brick.course_index
-                    course_bricks = [brick]
-                    continue
-                if brick.course_index != current_course:
-                    flush_course(course_bricks)
-                    current_course = brick.course_index
-                    course_bricks = [brick]
-                else:
-                    course_bricks.append(brick)
-            flush_course(course_bricks)
+        ordered: List[int] = []
+        # WallBuilder emits strides row by row, left to right, which is the build order.
+        for stride in wall.strides:
+            ordered.extend(sorted(stride.bricks, key=serpentine_key))
         return ordered
 
     def summarize(self, wall: Wall, order: Iterable[int]) -> str:
         order_list = order if isinstance(order, list) else list(order)
-        stride_sequence = [wall.brick_by_id(bid).stride_id for bid in order_list]
-        switches = 0
-        last_stride = None
-        for stride_id in stride_sequence:
-            if last_stride is None:
-                last_stride = stride_id
-                continue
-            if stride_id != last_stride:
-                switches += 1
-                last_stride = stride_id
-        distinct = len({s for s in stride_sequence})
+        stride_of = wall.stride_id
+        stride_sequence = [stride_of[bid] for bid in order_list]
+        switches = sum(prev != cur for prev, cur in pairwise(stride_sequence))
+        distinct = len(set(stride_sequence))
         return (
             f"stride switches={switches}, distinct strides={distinct}, total bricks={len(order_list)}"
         )
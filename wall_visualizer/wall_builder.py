@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import math
-from typing import List, Tuple
+from array import array
+from itertools import accumulate
+from typing import Dict, List, Sequence, Tuple
 
 from .bond import BondStrategy, default_bond
 from .config import DEFAULT_CONFIG, WallConfig
@@ -24,18 +26,23 @@ class WallBuilder:
         return Wall(config=self.config, bricks=bricks, strides=strides)
 
     def _generate_bricks(self) -> List[Brick]:
-        bricks: List[Brick] = []
-        course_count = self.config.course_count()
-        course_height = self.config.course_height_mm
-        brick_height = self.config.brick_full.height
+        config = self.config
+        generate_course = self.bond.generate_course
+        course_count = config.course_count()
+        course_height = config.course_height_mm
+        brick_height = config.brick_full.height
+        head_joint = config.head_joint_mm
 
+        bricks: List[Brick] = []
+        append = bricks.append
         brick_id = 0
         for course_idx in range(course_count):
             y = course_idx * course_height
-            sequence = self.bond.generate_course(course_idx, self.config)
-            x = 0.0
-            for index_in_course, spec in enumerate(sequence):
-                bricks.append(
+            sequence = generate_course(course_idx, config)
+            # Left edges are a prefix sum of (length + head joint) starting from zero.
+            xs = accumulate((spec.length_mm + head_joint for spec in sequence[:-1]), initial=0.0)
+            for index_in_course, (spec, x) in enumerate(zip(sequence, xs)):
+                append(
                     Brick(
                         brick_id=brick_id,
                         course_index=course_idx,
@@ -48,9 +55,6 @@ class WallBuilder:
                     )
                 )
                 brick_id += 1
-                x += spec.length_mm
-                if index_in_course < len(sequence) - 1:
-                    x += self.config.head_joint_mm
         return bricks
 
     def _generate_strides(self) -> List[Stride]:
@@ -88,12 +92,28 @@ class WallBuilder:
         stride_height = self.config.stride_height_mm
         cols, rows = self._stride_grid()
 
-        for brick in bricks:
-            col = min(int(brick.center_x // stride_width), cols - 1)
-            row = min(int(brick.center_y // stride_height), rows - 1)
-            stride_index = row * cols + col
+        stride_ids = _stride_ids(
+            [b.x_mm + b.length_mm / 2 for b in bricks],
+            [b.y_mm + b.height_mm / 2 for b in bricks],
+            stride_width,
+            stride_height,
+            cols,
+            rows,
+        )
+        counts = [0] * len(strides)
+        for stride_index in stride_ids:
+            counts[stride_index] += 1
+
+        # Counting sort: prefix offsets give each stride a contiguous, ascending slice.
+        offsets = list(accumulate(counts, initial=0))
+        cursors = offsets[:-1]
+        by_stride = array("i", bytes(array("i").itemsize * len(bricks)))
+        for brick, stride_index in zip(bricks, stride_ids):
             brick.stride_id = stride_index
-            strides[stride_index].bricks.append(brick.brick_id)
+            by_stride[cursors[stride_index]] = brick.brick_id
+            cursors[stride_index] += 1
+        for stride, start, end in zip(strides, offsets, offsets[1:]):
+            stride.bricks = by_stride[start:end]
 
     def _stride_grid(self) -> Tuple[int, int]:
         if self._stride_cols is None or self._stride_rows is None:
@@ -102,3 +122,26 @@ class WallBuilder:
             self._stride_cols = max(1, math.ceil(self.config.wall_width_mm / stride_width))
             self._stride_rows = max(1, math.ceil(self.config.wall_height_mm / stride_height))
         return self._stride_cols, self._stride_rows
+
+
+def _stride_ids(
+    centres_x: Sequence[float],
+    centres_y: Sequence[float],
+    stride_width: float,
+    stride_height: float,
+    cols: int,
+    rows: int,
+) -> List[int]:
+    """Map brick centres to row-major stride indices, clamping to the last row/column."""
+    # Every brick in a course shares its centre height, so resolve each row offset once.
+    row_offsets: Dict[float, int] = {}
+    ids: List[int] = []
+    append = ids.append
+    last_col = cols - 1
+    for cx, cy in zip(centres_x, centres_y):
+        row_offset = row_offsets.get(cy)
+        if row_offset is None:
+            row_offset = min(int(cy // stride_height), rows - 1) * cols
+            row_offsets[cy] = row_offset
+        append(row_offset + min(int(cx // stride_width), last_col))
+    return ids